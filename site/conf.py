@@ -78,3 +78,8 @@ html_static_path = ['_static']
 # Bump up per cell execution timeout to 300 seconds (from default 30 seconds)
 nb_execution_timeout = 300
 nb_execution_show_tb = True  # Print tracebacks to stderr
+# Cache executed notebooks with jupyter-cache (in _build/.jupyter_cache) so that
+# only notebooks whose code cells changed since the last build are re-executed
+nb_execution_mode = "cache"
+# Treat a cell exception as a failed execution, which jupyter-cache does not store
+nb_execution_allow_errors = False